@@ -3,12 +3,21 @@ Movie Genre Prediction API - Flask Inference Service
 Production-ready ML API with error handling, logging, and CORS support
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, stream_with_context
 from flask_cors import CORS
 import joblib
+import json
+import numpy as np
+import scipy.sparse
+import orjson
 import os
+import time
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # ===================================
@@ -16,22 +25,58 @@ from pathlib import Path
 # ===================================
 MODEL_PATH = "model/genre_model.pkl"
 VECTORIZER_PATH = "model/tfidf_vectorizer.pkl"
+CLASSES_PATH = "model/genre_classes.json"  # Genre names for models trained on int label codes
+WARMUP_FILE = "model/warmup_titles.txt"  # Optional: one common title per line
 LOG_FILE = "api.log"
 HOST = "0.0.0.0"
 PORT = 5000
+PREDICTION_CACHE_SIZE = 10000  # Max distinct titles kept in the prediction cache
+MIN_TITLE_LENGTH = 2
+MAX_TITLE_LENGTH = 200
 
 # ===================================
 # LOGGING SETUP
 # ===================================
+# Request threads only enqueue records; a background listener thread
+# does the formatting and file/console writes.
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+file_handler = logging.FileHandler(LOG_FILE)
+stream_handler = logging.StreamHandler()
+file_handler.setFormatter(log_formatter)
+stream_handler.setFormatter(log_formatter)
+
+queue_handler = QueueHandler(queue.Queue())
+log_listener = None
+
+
+def start_log_listener():
+    """Give queue_handler a fresh queue and a listener thread to drain it"""
+    global log_listener
+    queue_handler.queue = queue.Queue()
+    log_listener = QueueListener(queue_handler.queue, file_handler, stream_handler)
+    log_listener.start()
+
+
+def stop_log_listener():
+    """Flush queued records on shutdown"""
+    if log_listener is not None:
+        log_listener.stop()
+
+
+start_log_listener()
+atexit.register(stop_log_listener)
+
+# Threads don't survive fork(): a gunicorn worker forked from the preloading
+# master needs its own listener, or its records pile up in a queue nobody reads
+os.register_at_fork(after_in_child=start_log_listener)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',  # Full formatting happens in the listener's handlers
+    handlers=[queue_handler]
 )
 logger = logging.getLogger(__name__)
+logging.getLogger("werkzeug").setLevel(logging.WARNING)  # No per-request access log
 
 # ===================================
 # FLASK APP INITIALIZATION
@@ -39,42 +84,153 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend integration
 
+
+def _json_default(obj):
+    """numpy values for the stdlib json fallback"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(data):
+    """JSON bytes via orjson (much faster than stdlib json), falling back to stdlib
+    json for values orjson rejects, e.g. lone surrogates or ints beyond 64 bits"""
+    try:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    except orjson.JSONEncodeError:
+        return json.dumps(data, default=_json_default).encode()
+
+
+def json_response(data, status=200):
+    """Serialize a JSON response"""
+    return app.response_class(
+        dumps_json(data),
+        status=status,
+        mimetype="application/json"
+    )
+
+
+_TIMESTAMP = {"iso": "", "second": 0}
+
+
+def current_timestamp():
+    """ISO timestamp at second resolution, re-formatted at most once a second"""
+    second = int(time.time())
+    if second != _TIMESTAMP["second"]:
+        _TIMESTAMP["iso"] = datetime.fromtimestamp(second).isoformat()
+        _TIMESTAMP["second"] = second
+    return _TIMESTAMP["iso"]
+
 # ===================================
 # GLOBAL MODEL STORAGE
 # ===================================
 model = None
 vectorizer = None
 model_metadata = {}
+CLASSES = []  # model.classes_ as a plain Python list, cached at load time
+NUM_CLASSES = 0
+COEF_T = None  # (n_features, n_classes) float32, C-contiguous
+INTERCEPT = None  # (n_classes,) float32
+INLINE_PROBA = None  # _softmax_proba / _ovr_proba when it matches model.predict_proba
+ANALYZER = None  # vectorizer.build_analyzer(): lowercase, tokenize, stop words, n-grams
+VOCAB = {}  # term -> feature index
+IDF = None  # (n_features,) float32
+FAST_TFIDF = False  # True when fast_tfidf() matches vectorizer.transform
 
 # ===================================
 # MODEL LOADING
 # ===================================
 def load_models():
     """Load trained model and vectorizer on startup"""
-    global model, vectorizer, model_metadata
+    global model, vectorizer, model_metadata, CLASSES, NUM_CLASSES
+    global COEF_T, INTERCEPT, INLINE_PROBA
+    global ANALYZER, VOCAB, IDF, FAST_TFIDF
     
     try:
         logger.info("🚀 Starting model loading...")
         
-        # Validate file existence
-        if not os.path.exists(MODEL_PATH):
-            raise FileNotFoundError(f"Model file not found: {MODEL_PATH}")
-        if not os.path.exists(VECTORIZER_PATH):
-            raise FileNotFoundError(f"Vectorizer file not found: {VECTORIZER_PATH}")
+        # Validate file existence (one stat per file, also gives the size)
+        try:
+            model_size = os.stat(MODEL_PATH).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Model file not found: {MODEL_PATH}") from None
+        try:
+            vectorizer_size = os.stat(VECTORIZER_PATH).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Vectorizer file not found: {VECTORIZER_PATH}") from None
+        
+        # Load artifacts (numpy arrays are memory-mapped read-only when the
+        # files were saved uncompressed; compressed files load normally)
+        model = joblib.load(MODEL_PATH, mmap_mode="r")
+        CLASSES = model.classes_.tolist()
+        if os.path.exists(CLASSES_PATH):
+            # Model predicts int label codes; map them back to genre names
+            with open(CLASSES_PATH, encoding="utf-8") as f:
+                CLASSES = json.load(f)
+            if len(CLASSES) != len(model.classes_):
+                raise ValueError(f"{CLASSES_PATH} does not match the model's classes")
+        elif not all(isinstance(name, str) for name in CLASSES):
+            # Without the names file there is nothing to map label codes back to genres
+            raise FileNotFoundError(
+                f"Genre names file not found: {CLASSES_PATH} (the model predicts label codes)"
+            )
+        NUM_CLASSES = len(CLASSES)
+        vectorizer = joblib.load(VECTORIZER_PATH, mmap_mode="r")
         
-        # Load artifacts
-        model = joblib.load(MODEL_PATH)
-        vectorizer = joblib.load(VECTORIZER_PATH)
+        # Serve in float32 (artifacts from older training runs are float64).
+        # One-vs-rest models keep one LogisticRegression per genre.
+        if hasattr(vectorizer, "dtype"):
+            vectorizer.dtype = np.float32
+        estimators = getattr(model, "estimators_", [model])
+        for estimator in estimators:
+            estimator.coef_ = estimator.coef_.astype(np.float32, copy=False)
+            estimator.intercept_ = estimator.intercept_.astype(np.float32, copy=False)
+        
+        # Cache weights for the inlined probabilities and check which formula
+        # (multinomial softmax or one-vs-rest) reproduces model.predict_proba
+        COEF_T = np.ascontiguousarray(np.vstack([e.coef_ for e in estimators]).T, dtype=np.float32)
+        INTERCEPT = np.concatenate([e.intercept_ for e in estimators]).astype(np.float32)
+        probe = scipy.sparse.identity(COEF_T.shape[0], dtype=np.float32, format="csr")[:8]
+        expected = model.predict_proba(probe)
+        INLINE_PROBA = None
+        if COEF_T.shape[1] == NUM_CLASSES:
+            for inline_proba in (_softmax_proba, _ovr_proba):
+                if np.allclose(inline_proba(probe), expected, atol=1e-5):
+                    INLINE_PROBA = inline_proba
+                    break
+        if INLINE_PROBA is None:
+            logger.info("   Inline probabilities disabled, using model.predict_proba")
+        
+        # Cache the pieces of the TF-IDF transform for single-title inference
+        # and check fast_tfidf reproduces vectorizer.transform
+        FAST_TFIDF = False
+        if (
+            hasattr(vectorizer, "vocabulary_") and hasattr(vectorizer, "idf_")
+            and vectorizer.norm in ("l2", None) and not vectorizer.binary
+        ):
+            ANALYZER = vectorizer.build_analyzer()
+            VOCAB = vectorizer.vocabulary_
+            IDF = np.asarray(vectorizer.idf_, dtype=np.float32)
+            probe_titles = ["the dark knight", "toy story 2", "toy toy story", "zzz", "the"]
+            FAST_TFIDF = all(
+                np.allclose(fast_tfidf(t).toarray(), vectorizer.transform([t]).toarray(), atol=1e-6)
+                for t in probe_titles
+            )
+        if not FAST_TFIDF:
+            logger.info("   Fast TF-IDF disabled, using vectorizer.transform")
+        
+        # Cached predictions belong to the previous model
+        _predict_cached.cache_clear()
         
         # Store metadata
         model_metadata = {
             "model_loaded": True,
             "model_type": type(model).__name__,
-            "vocab_size": len(vectorizer.vocabulary_),
-            "num_classes": len(model.classes_),
-            "classes": model.classes_.tolist(),
-            "model_size_kb": round(os.path.getsize(MODEL_PATH) / 1024, 2),
-            "vectorizer_size_kb": round(os.path.getsize(VECTORIZER_PATH) / 1024, 2),
+            "vocab_size": COEF_T.shape[0],  # Number of features (hashed or vocabulary)
+            "num_classes": NUM_CLASSES,
+            "classes": CLASSES,
+            "model_size_kb": round(model_size / 1024, 2),
+            "vectorizer_size_kb": round(vectorizer_size / 1024, 2),
             "loaded_at": datetime.now().isoformat()
         }
         
@@ -83,56 +239,181 @@ def load_models():
         logger.info(f"   Classes: {model_metadata['classes']}")
         logger.info(f"   Vocabulary size: {model_metadata['vocab_size']}")
         
+        # Run one prediction through the single and batch paths so lazy
+        # imports and first-call costs are paid before the first request
+        try:
+            single = predict_genre("warmup title")
+            batch = predict_genres(["warmup title"])["warmup title"]
+            logger.info(f"   Warm-up prediction: {single['predicted_genre']} / {batch['predicted_genre']}")
+        except Exception as e:
+            logger.warning(f"Warm-up prediction failed: {str(e)}")
+        
+        warm_prediction_cache()
+        
         return True
         
     except Exception as e:
         logger.error(f"❌ Failed to load models: {str(e)}")
         raise
 
+def warm_prediction_cache():
+    """Pre-populate the prediction cache with common titles from WARMUP_FILE"""
+    if not os.path.exists(WARMUP_FILE):
+        return
+    
+    warmed = 0
+    with open(WARMUP_FILE, encoding="utf-8") as f:
+        for line in f:
+            if warmed >= PREDICTION_CACHE_SIZE:
+                break
+            
+            title, error = validate_title(line)
+            if error:
+                continue
+            
+            try:
+                _predict_cached(title)
+                warmed += 1
+            except Exception as e:
+                logger.warning(f"Warm-up prediction failed for '{title}': {str(e)}")
+    
+    logger.info(f"🔥 Prediction cache warmed with {warmed} titles")
+
 # ===================================
 # INPUT VALIDATION
 # ===================================
 def validate_title(title):
-    """Validate and clean input title"""
+    """Validate and clean input title in a single pass"""
     if not title:
         return None, "Title cannot be empty"
     
-    # Clean and normalize
+    if not isinstance(title, str):
+        return None, "Title must be a string"
+    
+    # Clean and normalize (str.lower already has a fast path for ASCII)
     title = title.strip().lower()
+    length = len(title)
     
-    if len(title) < 2:
-        return None, "Title must be at least 2 characters long"
+    if length < MIN_TITLE_LENGTH:
+        return None, f"Title must be at least {MIN_TITLE_LENGTH} characters long"
     
-    if len(title) > 200:
-        return None, "Title too long (max 200 characters)"
+    if length > MAX_TITLE_LENGTH:
+        return None, f"Title too long (max {MAX_TITLE_LENGTH} characters)"
     
     return title, None
 
 # ===================================
 # PREDICTION ENGINE
 # ===================================
-def predict_genre(title):
-    """Make genre prediction for a given title"""
+def fast_tfidf(title):
+    """TF-IDF row for one title without TfidfVectorizer.transform's overhead"""
+    counts = {}
+    for term in ANALYZER(title):
+        idx = VOCAB.get(term)
+        if idx is not None:
+            counts[idx] = counts.get(idx, 0) + 1
+    
+    indices = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+    data = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    
+    if vectorizer.sublinear_tf:
+        np.log(data, out=data)
+        data += 1
+    if vectorizer.use_idf:
+        data *= IDF[indices]
+    if vectorizer.norm == "l2" and len(data):
+        data /= np.sqrt(np.dot(data, data))
+    
+    return scipy.sparse.csr_matrix(
+        (data, indices, np.array([0, len(indices)], dtype=np.int32)),
+        shape=(1, len(VOCAB))
+    )
+
+
+def transform_title(title):
+    """TF-IDF features for a single processed title"""
+    if FAST_TFIDF:
+        return fast_tfidf(title)
+    return vectorizer.transform([title])
+
+
+def _linear_scores(title_vecs):
+    """Per-class decision scores X @ COEF_T + INTERCEPT"""
+    # Keep the whole (n, n_features) x (n_features, n_classes) product in
+    # float32; mixing in float64 features would upcast every row
+    if title_vecs.dtype != np.float32:
+        title_vecs = title_vecs.astype(np.float32)
+    
+    scores = title_vecs @ COEF_T
+    scores += INTERCEPT
+    return scores
+
+
+def _softmax_proba(title_vecs):
+    """Multinomial logistic regression probabilities computed directly"""
+    scores = _linear_scores(title_vecs)
+    scores -= scores.max(axis=1, keepdims=True)
+    np.exp(scores, out=scores)
+    scores /= scores.sum(axis=1, keepdims=True)
+    return scores
+
+
+def _ovr_proba(title_vecs):
+    """One-vs-rest probabilities: per-genre sigmoid, normalized per row"""
+    scores = _linear_scores(title_vecs)
+    np.negative(scores, out=scores)
+    np.exp(scores, out=scores)
+    scores += 1
+    np.reciprocal(scores, out=scores)
+    scores /= scores.sum(axis=1, keepdims=True)
+    return scores
+
+
+def predict_proba(title_vecs):
+    """Class probabilities for TF-IDF rows, skipping scikit-learn's input checks when possible"""
+    if INLINE_PROBA is not None:
+        return INLINE_PROBA(title_vecs)
+    return model.predict_proba(title_vecs)
+
+
+@lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def _predict_cached(title):
+    """Run the model on a processed title (cached; the probability array is read-only)"""
+    # Transform input using TF-IDF vectorizer
+    title_vec = transform_title(title)
+    
+    # Pick the top class before rounding, so near-ties resolve like model.predict
+    raw_probabilities = predict_proba(title_vec)[0].astype(np.float64)
+    top = int(raw_probabilities.argmax())
+    prediction = CLASSES[top]
+
+    # Round once in numpy for the response
+    probabilities = raw_probabilities.round(4)
+    probabilities.flags.writeable = False  # Shared by every cache hit
+    
+    # Get confidence (max probability)
+    confidence = float(probabilities[top])
+    
+    return prediction, confidence, probabilities
+
+
+def predict_genre(title, top_k=None):
+    """Make genre prediction for a given title, optionally keeping only the top_k classes"""
     try:
-        # Transform input using TF-IDF vectorizer
-        title_vec = vectorizer.transform([title])
-        
-        # Get prediction and probability
-        prediction = model.predict(title_vec)[0]
-        probabilities = model.predict_proba(title_vec)[0]
+        prediction, confidence, probabilities = _predict_cached(title)
         
-        # Get confidence (max probability)
-        confidence = float(max(probabilities))
-        
-        # Get all class probabilities
-        class_probs = {
-            genre: round(float(prob), 4)
-            for genre, prob in zip(model.classes_, probabilities)
-        }
+        if top_k:
+            # Select the k most likely classes without sorting all of them
+            k = min(top_k, NUM_CLASSES)
+            idx = np.argpartition(probabilities, -k)[-k:]
+            idx = idx[np.argsort(-probabilities[idx])]
+            class_probs = {CLASSES[i]: float(probabilities[i]) for i in idx.tolist()}
+        else:
+            class_probs = dict(zip(CLASSES, probabilities.tolist()))
         
         return {
             "predicted_genre": prediction,
-            "confidence": round(confidence, 4),
+            "confidence": confidence,
             "all_probabilities": class_probs
         }
         
@@ -140,6 +421,31 @@ def predict_genre(title):
         logger.error(f"Prediction error: {str(e)}")
         raise
 
+
+def predict_genres(titles):
+    """Predict many titles at once; returns {processed title: prediction}"""
+    try:
+        # One transform + predict_proba over the unique titles only
+        # dict.fromkeys keeps the exact strings (a numpy <U array drops trailing NULs)
+        unique_titles = list(dict.fromkeys(titles))
+        title_vecs = vectorizer.transform(unique_titles)
+        probabilities = predict_proba(title_vecs).astype(np.float64)
+        pred_idx = probabilities.argmax(axis=1).tolist()
+        rounded = probabilities.round(4).tolist()
+        
+        return {
+            title: {
+                "predicted_genre": CLASSES[top],
+                "confidence": probs[top],
+                "all_probabilities": dict(zip(CLASSES, probs))
+            }
+            for title, top, probs in zip(unique_titles, pred_idx, rounded)
+        }
+        
+    except Exception as e:
+        logger.error(f"Batch prediction error: {str(e)}")
+        raise
+
 # ===================================
 # API ROUTES
 # ===================================
@@ -147,26 +453,26 @@ def predict_genre(title):
 @app.route("/", methods=["GET"])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return json_response({
         "status": "running",
         "service": "Movie Genre Prediction API",
         "model_loaded": model is not None,
-        "timestamp": datetime.now().isoformat()
-    }), 200
+        "timestamp": current_timestamp()
+    }, 200)
 
 
 @app.route("/info", methods=["GET"])
 def model_info():
     """Get model metadata and information"""
     if not model:
-        return jsonify({
+        return json_response({
             "error": "Model not loaded"
-        }), 503
+        }, 503)
     
-    return jsonify({
+    return json_response({
         "status": "success",
         "metadata": model_metadata
-    }), 200
+    }, 200)
 
 
 @app.route("/predict", methods=["POST"])
@@ -176,7 +482,8 @@ def predict():
     
     Request body:
     {
-        "title": "The Dark Knight"
+        "title": "The Dark Knight",
+        "top_k": 3              (optional: only return the 3 most likely genres)
     }
     
     Response:
@@ -202,66 +509,72 @@ def predict():
     # Check if model is loaded
     if not model or not vectorizer:
         logger.error("Prediction attempt with unloaded model")
-        return jsonify({
+        return json_response({
             "status": "error",
             "error": "Model not loaded. Please contact administrator."
-        }), 503
+        }, 503)
     
     # Parse request
     try:
         data = request.get_json()
     except Exception as e:
         logger.warning(f"Invalid JSON received: {str(e)}")
-        return jsonify({
+        return json_response({
             "status": "error",
             "error": "Invalid JSON format"
-        }), 400
+        }, 400)
     
     # Validate input
     if not data:
-        return jsonify({
+        return json_response({
             "status": "error",
             "error": "Request body is required"
-        }), 400
+        }, 400)
     
     if "title" not in data:
-        return jsonify({
+        return json_response({
             "status": "error",
             "error": "Missing 'title' field in request body"
-        }), 400
+        }, 400)
     
     original_title = data["title"]
+    top_k = data.get("top_k")
     
     # Validate and clean title
     processed_title, error = validate_title(original_title)
     if error:
-        return jsonify({
+        return json_response({
             "status": "error",
             "error": error
-        }), 400
+        }, 400)
+    
+    if top_k is not None and (not isinstance(top_k, int) or isinstance(top_k, bool) or top_k < 1):
+        return json_response({
+            "status": "error",
+            "error": "'top_k' must be a positive integer"
+        }, 400)
     
     # Make prediction
     try:
-        result = predict_genre(processed_title)
-        
-        logger.info(f"Prediction made: '{processed_title}' → {result['predicted_genre']} (confidence: {result['confidence']})")
-        
-        return jsonify({
-            "status": "success",
-            "input": {
-                "original_title": original_title,
-                "processed_title": processed_title
-            },
-            "prediction": result,
-            "timestamp": datetime.now().isoformat()
-        }), 200
-        
+        result = predict_genre(processed_title, top_k)
     except Exception as e:
         logger.error(f"Prediction failed: {str(e)}")
-        return jsonify({
+        return json_response({
             "status": "error",
             "error": "Prediction failed. Please try again."
-        }), 500
+        }, 500)
+    
+    logger.info(f"Prediction made: '{processed_title}' → {result['predicted_genre']} (confidence: {result['confidence']})")
+    
+    return json_response({
+        "status": "success",
+        "input": {
+            "original_title": original_title,
+            "processed_title": processed_title
+        },
+        "prediction": result,
+        "timestamp": current_timestamp()
+    }, 200)
 
 
 @app.route("/batch-predict", methods=["POST"])
@@ -275,83 +588,139 @@ def batch_predict():
     }
     """
     
+    titles, error_response = parse_batch_request()
+    if error_response:
+        return error_response
+    
+    results = []
+    errors = []
+    
+    for record in batch_records(titles):
+        if "error" in record:
+            errors.append(record)
+        else:
+            results.append(record)
+    
+    logger.info(f"Batch prediction: {len(results)} successful, {len(errors)} failed")
+    
+    return json_response({
+        "status": "success",
+        "results": results,
+        "errors": errors,
+        "summary": {
+            "total": len(titles),
+            "successful": len(results),
+            "failed": len(errors)
+        },
+        "timestamp": current_timestamp()
+    }, 200)
+
+
+@app.route("/batch-predict-stream", methods=["POST"])
+def batch_predict_stream():
+    """
+    Predict genres for multiple titles, streamed as NDJSON
+    
+    Request body is the same as /batch-predict. Each response line is one
+    result or error record (in input order), followed by a summary line:
+    {"index": 0, "original_title": "Inception", "processed_title": "inception", "prediction": {...}}
+    {"index": 1, "title": "", "error": "Title cannot be empty"}
+    {"summary": {"total": 2, "successful": 1, "failed": 1}, "timestamp": "..."}
+    """
+    
+    titles, error_response = parse_batch_request()
+    if error_response:
+        return error_response
+    
+    def generate():
+        failed = 0
+        for record in batch_records(titles):
+            if "error" in record:
+                failed += 1
+            yield dumps_json(record) + b"\n"
+        
+        logger.info(f"Streamed batch prediction: {len(titles) - failed} successful, {failed} failed")
+        
+        yield dumps_json({
+            "summary": {
+                "total": len(titles),
+                "successful": len(titles) - failed,
+                "failed": failed
+            },
+            "timestamp": current_timestamp()
+        }) + b"\n"
+    
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+def parse_batch_request():
+    """Validate a batch request body; returns (titles, error_response)"""
     if not model or not vectorizer:
-        return jsonify({
+        return None, json_response({
             "status": "error",
             "error": "Model not loaded"
-        }), 503
+        }, 503)
     
     try:
         data = request.get_json()
     except:
-        return jsonify({
+        return None, json_response({
             "status": "error",
             "error": "Invalid JSON format"
-        }), 400
+        }, 400)
     
     if not data or "titles" not in data:
-        return jsonify({
+        return None, json_response({
             "status": "error",
             "error": "Missing 'titles' field"
-        }), 400
+        }, 400)
     
     titles = data["titles"]
     
     if not isinstance(titles, list):
-        return jsonify({
+        return None, json_response({
             "status": "error",
             "error": "'titles' must be an array"
-        }), 400
+        }, 400)
     
     if len(titles) > 100:
-        return jsonify({
+        return None, json_response({
             "status": "error",
             "error": "Maximum 100 titles per batch request"
-        }), 400
+        }, 400)
     
-    # Process each title
-    results = []
-    errors = []
+    return titles, None
+
+
+def batch_records(titles):
+    """Yield one result or error record per title, in input order"""
+    validated = [validate_title(title) for title in titles]
     
-    for idx, title in enumerate(titles):
-        processed_title, error = validate_title(title)
-        
+    # Predict all unique valid titles with a single transform + predict_proba call
+    valid_titles = [processed_title for processed_title, error in validated if not error]
+    try:
+        predictions = predict_genres(valid_titles) if valid_titles else {}
+        prediction_error = None
+    except Exception as e:
+        predictions = {}
+        prediction_error = str(e)
+    
+    for idx, (title, (processed_title, error)) in enumerate(zip(titles, validated)):
+        error = error or prediction_error
         if error:
-            errors.append({
+            yield {
                 "index": idx,
                 "title": title,
                 "error": error
-            })
+            }
             continue
         
-        try:
-            prediction = predict_genre(processed_title)
-            results.append({
-                "index": idx,
-                "original_title": title,
-                "processed_title": processed_title,
-                "prediction": prediction
-            })
-        except Exception as e:
-            errors.append({
-                "index": idx,
-                "title": title,
-                "error": str(e)
-            })
-    
-    logger.info(f"Batch prediction: {len(results)} successful, {len(errors)} failed")
-    
-    return jsonify({
-        "status": "success",
-        "results": results,
-        "errors": errors,
-        "summary": {
-            "total": len(titles),
-            "successful": len(results),
-            "failed": len(errors)
-        },
-        "timestamp": datetime.now().isoformat()
-    }), 200
+        yield {
+            "index": idx,
+            "original_title": title,
+            "processed_title": processed_title,
+            "prediction": predictions[processed_title]
+        }
 
 
 # ===================================
@@ -360,33 +729,46 @@ def batch_predict():
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
+    return json_response({
         "status": "error",
         "error": "Endpoint not found"
-    }), 404
+    }, 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     logger.error(f"Internal server error: {str(error)}")
-    return jsonify({
+    return json_response({
         "status": "error",
         "error": "Internal server error"
-    }), 500
+    }, 500)
+
+
+# ===================================
+# MODEL INITIALIZATION
+# ===================================
+# Load at import time so `gunicorn --preload` shares a single copy of the
+# model and vectorizer across all worker threads.
+try:
+    load_models()
+except Exception as e:
+    logger.error(f"Failed to start API: {str(e)}")
+    print(f"\n❌ Failed to start API: {str(e)}\n")
+    exit(1)
 
 
 # ===================================
 # STARTUP
 # ===================================
+# Development only - in production run:
+#   gunicorn -c gunicorn.conf.py
 
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("🎬 MOVIE GENRE PREDICTION API")
     print("="*60)
     
-    # Load models
     try:
-        load_models()
         print(f"\n🚀 API Server starting on http://{HOST}:{PORT}")
         print(f"📊 Loaded genres: {', '.join(model_metadata['classes'])}")
         print("\n📝 Available endpoints:")
@@ -394,10 +776,11 @@ if __name__ == "__main__":
         print(f"   GET  /info - Model information")
         print(f"   POST /predict - Single prediction")
         print(f"   POST /batch-predict - Batch predictions")
+        print(f"   POST /batch-predict-stream - Batch predictions (NDJSON stream)")
         print("\n" + "="*60 + "\n")
         
         # Start Flask app
-        app.run(host=HOST, port=PORT, debug=True)
+        app.run(host=HOST, port=PORT, debug=False, use_reloader=False, threaded=True)
         
     except Exception as e:
         logger.error(f"Failed to start API: {str(e)}")
@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for the Movie Genre Prediction API
+Single worker + thread pool so the model is loaded into memory only once
+"""
+
+import os
+
+# ===================================
+# SERVER
+# ===================================
+wsgi_app = "app:app"
+chdir = os.path.dirname(os.path.abspath(__file__))  # model paths are relative to ml/
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# ===================================
+# WORKERS
+# ===================================
+# One process keeps a single copy of the model in RAM; threads serve requests
+# concurrently since scikit-learn/scipy release the GIL in their native code.
+workers = 1
+worker_class = "gthread"
+threads = (os.cpu_count() or 1) * 2
+preload_app = True  # load_models() runs once, before serving
+timeout = 30
@@ -47,6 +47,15 @@ def test_single_prediction():
         )
         print_response(f"Prediction: '{title}'", response)
 
+def test_top_k_prediction():
+    """Test single prediction limited to the top_k genres"""
+    response = requests.post(
+        f"{API_URL}/predict",
+        json={"title": "Toy Story", "top_k": 2},
+        headers={"Content-Type": "application/json"}
+    )
+    print_response("Top-2 Prediction: 'Toy Story'", response)
+
 def test_batch_prediction():
     """Test batch prediction"""
     titles = [
@@ -64,6 +73,32 @@ def test_batch_prediction():
     )
     print_response("Batch Prediction", response)
 
+def test_batch_prediction_stream():
+    """Test streaming batch prediction (NDJSON)"""
+    titles = [
+        "Inception",
+        "Toy Story",
+        "",
+        "Inception"
+    ]
+    
+    response = requests.post(
+        f"{API_URL}/batch-predict-stream",
+        json={"titles": titles},
+        headers={"Content-Type": "application/json"},
+        stream=True
+    )
+    
+    print(f"\n{'='*60}")
+    print("TEST: Streaming Batch Prediction")
+    print(f"{'='*60}")
+    print(f"Status Code: {response.status_code}")
+    print("Response lines:")
+    for line in response.iter_lines():
+        if line:
+            print(json.dumps(json.loads(line)))
+    print(f"{'='*60}\n")
+
 def test_error_cases():
     """Test error handling"""
     print("\n" + "="*60)
@@ -86,6 +121,22 @@ def test_error_cases():
     )
     print_response("Missing Title Field Error", response)
     
+    # top_k must be a positive integer
+    response = requests.post(
+        f"{API_URL}/predict",
+        json={"title": "Toy Story", "top_k": 0},
+        headers={"Content-Type": "application/json"}
+    )
+    print_response("Zero top_k Error", response)
+    
+    # top_k given as a string
+    response = requests.post(
+        f"{API_URL}/predict",
+        json={"title": "Toy Story", "top_k": "3"},
+        headers={"Content-Type": "application/json"}
+    )
+    print_response("String top_k Error", response)
+    
     # Invalid endpoint
     response = requests.get(f"{API_URL}/invalid")
     print_response("Invalid Endpoint Error", response)
@@ -102,7 +153,9 @@ if __name__ == "__main__":
         test_health_check()
         test_model_info()
         test_single_prediction()
+        test_top_k_prediction()
         test_batch_prediction()
+        test_batch_prediction_stream()
         test_error_cases()
         
         print("\n✅ All tests completed!\n")
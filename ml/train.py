@@ -4,14 +4,39 @@ Optimized for performance, scalability, and interview readiness
 """
 
 import pandas as pd
+import numpy as np
+import scipy.sparse
 import joblib
+from joblib import Parallel, delayed, effective_n_jobs, parallel_config
 import os
+import re
+import json
+import hashlib
+from functools import lru_cache
 from pathlib import Path
 import time
+from threadpoolctl import threadpool_limits
 
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.feature_extraction.text import TfidfVectorizer
+# Optional: compiled sparse scoring for the quick-test predictor (pip install numba)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional: Intel oneDAL kernels for LogisticRegression (pip install scikit-learn-intelex).
+# Must patch before any sklearn estimator is imported.
+try:
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    pass
+
+from sklearn.model_selection import StratifiedKFold, StratifiedShuffleSplit, cross_val_score
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.base import clone
 from sklearn.linear_model import LogisticRegression
+from sklearn.multiclass import OneVsRestClassifier
 from sklearn.metrics import (
     accuracy_score, 
     classification_report, 
@@ -25,19 +50,37 @@ from sklearn.metrics import (
 PROCESSED_DATA_PATH = "data/processed/movies_clean.csv"
 MODEL_OUTPUT_PATH = "model/genre_model.pkl"
 VECTORIZER_OUTPUT_PATH = "model/tfidf_vectorizer.pkl"
+CLASSES_OUTPUT_PATH = "model/genre_classes.json"  # Genre name for each int label code
+PIPELINE_OUTPUT_PATH = "model/genre_pipeline.pkl"  # Vectorizer + model in one artifact (title in, code out)
+FEATURE_CACHE_DIR = "cache"  # Cached filtered dataset + TF-IDF matrices; delete to force a rebuild
 
 # Model Hyperparameters
 TEST_SIZE = 0.2
 RANDOM_STATE = 42
 TFIDF_MAX_FEATURES = 8000  # Increased for better feature coverage
 TFIDF_NGRAM_RANGE = (1, 2)
+TFIDF_USE_HASHING = False  # HashingVectorizer + TfidfTransformer: no vocabulary pass (large corpora)
+TFIDF_HASH_FEATURES = 2**20  # Hashed feature space when TFIDF_USE_HASHING is on
+HASHING_N_JOBS = -1  # Processes used to shard hashing over large corpora
+HASHING_PARALLEL_MIN_SAMPLES = 50_000  # Below this, process start-up costs more than it saves
 MODEL_MAX_ITER = 1000
+OVR_N_JOBS = -1  # Threads fitting one-vs-rest genres concurrently (liblinear releases the GIL)
+NEWTON_MAX_CLASSES = 16  # newton-cholesky only for a handful of genres...
+NEWTON_MAX_COEFS = 4000  # ...and a small coefficient matrix (its Hessian is this size squared)
 CV_FOLDS = 5  # Cross-validation folds
+CV_N_JOBS = -1  # Folds fitted in parallel, one BLAS thread each
+EVAL_TRAIN_ACCURACY = False  # Extra predict pass over the training matrix for the overfitting check
+USE_CUML = os.environ.get("USE_CUML") == "1"  # Fit on the GPU with cuML's L-BFGS ("qn") solver...
+CUML_MIN_SAMPLES = 100_000  # ...once the corpus is big enough to pay for the host→GPU copy
 
 # Minimum samples per genre (for quality filtering)
 MIN_SAMPLES_PER_GENRE = 20
 
 
+# Same tokens as scikit-learn's default token_pattern
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+
 # ===================================
 # UTILITY FUNCTIONS
 # ===================================
@@ -56,7 +99,8 @@ def load_and_validate_data(file_path):
     print("\n📥 Loading processed dataset...")
     
     try:
-        df = pd.read_csv(file_path)
+        # Arrow-backed strings: one contiguous buffer, vectorized .str operations
+        df = pd.read_csv(file_path, dtype={"title": "string[pyarrow]", "genre": "string[pyarrow]"})
         
         # Validate required columns
         required_cols = ["title", "genre"]
@@ -95,64 +139,309 @@ def filter_rare_genres(df, min_samples):
     return df
 
 
-def print_dataset_stats(X, y):
-    """Print comprehensive dataset statistics"""
+def load_filtered_data(file_path, min_samples):
+    """load_and_validate_data + filter_rare_genres, cached on disk as Feather"""
+    stat = os.stat(file_path)
+    key_source = repr((stat.st_size, stat.st_mtime_ns, min_samples))
+    key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+    cache_path = Path(FEATURE_CACHE_DIR) / f"filtered_{key}.feather"
+    
+    if cache_path.exists():
+        print(f"\n♻️  Loading cached filtered dataset ({key[:8]})...")
+        df = pd.read_feather(cache_path)
+        print(f"✅ Loaded {len(df):,} samples")
+        return df
+    
+    df = load_and_validate_data(file_path)
+    df = filter_rare_genres(df, min_samples).reset_index(drop=True)
+    
+    # Feather is Arrow IPC: the Arrow string columns are written and read back as-is
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_feather(cache_path)
+    
+    return df
+
+
+def print_dataset_stats(X, y, class_names):
+    """Print comprehensive dataset statistics (y: int label codes into class_names)"""
+    counts = np.bincount(y, minlength=len(class_names))
+    name_width = max(len(name) for name in class_names)
+    
     print("\n" + "="*60)
     print("📊 DATASET STATISTICS")
     print("="*60)
     print(f"Total samples: {len(X):,}")
-    print(f"Unique genres: {y.nunique()}")
+    print(f"Unique genres: {np.count_nonzero(counts)}")
     print(f"Average title length: {X.str.len().mean():.1f} characters")
     print(f"\nGenre distribution:")
-    print(y.value_counts().to_string())
+    for code in np.argsort(-counts, kind="stable"):
+        print(f"{class_names[code]:<{name_width}}  {counts[code]:>6,}")
     print("="*60)
 
 
+@lru_cache(maxsize=None)
+def _tokenize(title):
+    """Lowercase + tokenize a title once; repeated titles hit the cache"""
+    return tuple(TOKEN_PATTERN.findall(title.lower()))
+
+
+def _use_default_tokenizer(vectorizer):
+    """Swap _tokenize for the equivalent built-in tokenizer before saving"""
+    text_vectorizer = vectorizer.steps[0][1] if isinstance(vectorizer, Pipeline) else vectorizer
+    text_vectorizer.set_params(
+        tokenizer=None,
+        token_pattern=TOKEN_PATTERN.pattern,
+        lowercase=True
+    )
+
+
+def build_hashing_vectorizer(vectorizer_params):
+    """HashingVectorizer + TfidfTransformer stand-in for TfidfVectorizer(**vectorizer_params)"""
+    params = dict(vectorizer_params)
+    sublinear_tf = params.pop("sublinear_tf", False)
+    
+    # Vocabulary pruning options have no equivalent without a vocabulary
+    params.pop("max_features", None)
+    params.pop("min_df", None)
+    
+    return Pipeline([
+        ("hashing", HashingVectorizer(
+            n_features=TFIDF_HASH_FEATURES,
+            alternate_sign=False,
+            norm=None,
+            **params
+        )),
+        ("tfidf", TfidfTransformer(sublinear_tf=sublinear_tf))
+    ])
+
+
+def hash_transform(hashing, X):
+    """HashingVectorizer.transform, sharded across processes for large inputs"""
+    n_jobs = effective_n_jobs(HASHING_N_JOBS)
+    if n_jobs == 1 or len(X) < HASHING_PARALLEL_MIN_SAMPLES:
+        return hashing.transform(X)
+    
+    # Stateless, so every shard can be hashed independently and stacked.
+    # Workers get the equivalent built-in tokenizer (_tokenize lives in __main__).
+    worker_hashing = clone(hashing)
+    _use_default_tokenizer(worker_hashing)
+    shards = np.array_split(np.asarray(X, dtype=object), n_jobs)
+    results = Parallel(n_jobs=n_jobs, prefer="processes")(
+        delayed(worker_hashing.transform)(shard) for shard in shards
+    )
+    return scipy.sparse.vstack(results, format="csr")
+
+
 def create_features(X_train, X_test, vectorizer_params):
     """Create TF-IDF features from text data"""
     print("\n🔧 Creating TF-IDF features...")
     
     start_time = time.time()
     
-    vectorizer = TfidfVectorizer(**vectorizer_params)
-    X_train_vec = vectorizer.fit_transform(X_train)
-    X_test_vec = vectorizer.transform(X_test)
+    # Tokenize with the cached compiled-regex tokenizer
+    vectorizer_params = dict(
+        vectorizer_params,
+        tokenizer=_tokenize,
+        token_pattern=None,
+        lowercase=False  # _tokenize lowercases
+    )
+    
+    if TFIDF_USE_HASHING:
+        # Single stateless pass over the text, no {term: index} dict to build
+        vectorizer = build_hashing_vectorizer(vectorizer_params)
+        hashing = vectorizer.named_steps["hashing"]
+        tfidf = vectorizer.named_steps["tfidf"]
+        X_train_vec = tfidf.fit_transform(hash_transform(hashing, X_train))
+        X_test_vec = tfidf.transform(hash_transform(hashing, X_test))
+    else:
+        vectorizer = TfidfVectorizer(**vectorizer_params)
+        X_train_vec = vectorizer.fit_transform(X_train)
+        X_test_vec = vectorizer.transform(X_test)
+
+    # SpMV in the solver is memory-bound: float32 halves the bytes per nonzero.
+    # No copy when dtype=np.float32 already reached the vectorizer.
+    X_train_vec = X_train_vec.astype(np.float32, copy=False)
+    X_test_vec = X_test_vec.astype(np.float32, copy=False)
+
+    # Sorted column indices, no stored zeros: each row streams through memory in order
+    for X_vec in (X_train_vec, X_test_vec):
+        X_vec.eliminate_zeros()
+        X_vec.sort_indices()
+
+    # The saved vectorizer must not reference this module or carry the cache
+    _use_default_tokenizer(vectorizer)
+    _tokenize.cache_clear()
     
     elapsed = time.time() - start_time
     
     print(f"✅ Vectorization complete in {elapsed:.2f}s")
     print(f"   Feature matrix shape: {X_train_vec.shape}")
-    print(f"   Vocabulary size: {len(vectorizer.vocabulary_):,}")
+    if hasattr(vectorizer, "vocabulary_"):
+        print(f"   Vocabulary size: {len(vectorizer.vocabulary_):,}")
     
     return X_train_vec, X_test_vec, vectorizer
 
 
+def _pick_solver(X, y):
+    """Choose LogisticRegression solver settings from the shape of the problem"""
+    n_samples, n_features = X.shape
+    n_classes = len(np.unique(y))
+    sparsity = 1 - X.nnz / (n_samples * n_features)
+    
+    model_params = {
+        "max_iter": MODEL_MAX_ITER,
+        "random_state": RANDOM_STATE
+    }
+    
+    if USE_CUML and n_samples >= CUML_MIN_SAMPLES:
+        # Large corpora on a GPU: the SpMV + softmax run on CUDA cores
+        model_params.update(solver="qn")
+    elif n_classes > 50 and n_samples > 100_000:
+        # Many classes on a large corpus: L1 saga keeps the weight matrix sparse
+        model_params.update(solver="saga", l1_ratio=1.0)
+    elif n_features > 10 * n_samples or sparsity > 0.99:
+        # Wide, very sparse TF-IDF: liblinear's coordinate descent, one genre at a time
+        # Each binary genre-vs-rest problem is balanced on its own; sklearnex
+        # has no liblinear kernel, so class_weight costs nothing here
+        model_params.update(solver="liblinear", multi_class="ovr", class_weight="balanced")
+    elif n_classes <= NEWTON_MAX_CLASSES and n_features * n_classes <= NEWTON_MAX_COEFS:
+        # Few coefficients: a handful of Cholesky-factored Newton steps beats many lbfgs iterations
+        model_params.update(solver="newton-cholesky")
+    else:
+        model_params.update(solver="lbfgs")
+    
+    print(f"\n⚙️  Solver: {model_params['solver']} "
+          f"({n_samples:,} samples, {n_features:,} features, {n_classes} classes, "
+          f"{sparsity * 100:.2f}% sparse)")
+    
+    return model_params
+
+
+def load_or_create_features(X_train, X_test, vectorizer_params):
+    """create_features with an on-disk cache keyed by the data file and feature settings"""
+    key_source = repr((
+        sorted(vectorizer_params.items()),
+        TFIDF_USE_HASHING,
+        TFIDF_HASH_FEATURES,
+        MIN_SAMPLES_PER_GENRE,
+        TEST_SIZE,
+        RANDOM_STATE,
+        os.stat(PROCESSED_DATA_PATH).st_mtime_ns
+    ))
+    key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+    
+    cache_dir = Path(FEATURE_CACHE_DIR)
+    train_path = cache_dir / f"features_{key}_train.npz"
+    test_path = cache_dir / f"features_{key}_test.npz"
+    vectorizer_path = cache_dir / f"features_{key}_vectorizer.pkl"
+    
+    if train_path.exists() and test_path.exists() and vectorizer_path.exists():
+        print(f"\n♻️  Loading cached TF-IDF features ({key[:8]})...")
+        X_train_vec = scipy.sparse.load_npz(train_path)
+        X_test_vec = scipy.sparse.load_npz(test_path)
+        vectorizer = joblib.load(vectorizer_path)
+        print(f"   Feature matrix shape: {X_train_vec.shape}")
+        return X_train_vec, X_test_vec, vectorizer
+    
+    X_train_vec, X_test_vec, vectorizer = create_features(X_train, X_test, vectorizer_params)
+    
+    # Uncompressed: loading is then a straight read of data/indices/indptr
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    scipy.sparse.save_npz(train_path, X_train_vec, compressed=False)
+    scipy.sparse.save_npz(test_path, X_test_vec, compressed=False)
+    joblib.dump(vectorizer, vectorizer_path, protocol=5)
+    
+    return X_train_vec, X_test_vec, vectorizer
+
+
+def _balanced_sample_weight(y):
+    """compute_sample_weight("balanced", y) for int label codes: n / (n_classes * count)"""
+    counts = np.bincount(y)
+    class_weights = len(y) / (np.count_nonzero(counts) * np.maximum(counts, 1))
+    return class_weights[y]
+
+
+def _fit_params(model, y):
+    """Balanced sample weights for models that don't balance genres via class_weight"""
+    if isinstance(model, OneVsRestClassifier):
+        return {}
+    
+    # Same weighting as class_weight="balanced", but keeps sklearnex's oneDAL path enabled
+    return {"sample_weight": _balanced_sample_weight(y)}
+
+
+def _train_cuml(X_train, y_train, model_params):
+    """Fit cuML's LogisticRegression on the GPU and return it as a scikit-learn model"""
+    import cupy
+    import cupyx.scipy.sparse
+    from cuml.linear_model import LogisticRegression as CuLogisticRegression
+    
+    X_gpu = cupyx.scipy.sparse.csr_matrix(X_train.astype(np.float32))
+    y_gpu = cupy.asarray(y_train)
+    weights_gpu = cupy.asarray(_balanced_sample_weight(y_train))
+    
+    gpu_model = CuLogisticRegression(
+        penalty="l2",
+        solver="qn",
+        max_iter=model_params["max_iter"],
+        output_type="numpy"  # Fitted attributes come back as host arrays
+    )
+    gpu_model.fit(X_gpu, y_gpu, sample_weight=weights_gpu)
+    
+    # Same weights in a CPU estimator: CV, saved artifacts and the API need no GPU
+    model = LogisticRegression(max_iter=model_params["max_iter"], random_state=RANDOM_STATE)
+    model.classes_ = np.asarray(gpu_model.classes_)
+    model.coef_ = np.asarray(gpu_model.coef_).reshape(-1, X_train.shape[1])
+    model.intercept_ = np.asarray(gpu_model.intercept_).ravel()
+    model.n_features_in_ = X_train.shape[1]
+    return model
+
+
 def train_model(X_train, y_train, model_params):
     """Train the classification model"""
     print("\n🚀 Training model...")
     
     start_time = time.time()
     
-    model = LogisticRegression(**model_params)
-    model.fit(X_train, y_train)
+    if model_params["solver"] == "qn":
+        model = _train_cuml(X_train, y_train, model_params)
+    else:
+        # multi_class="ovr" fits one binary LogisticRegression per genre
+        params = dict(model_params)
+        one_vs_rest = params.pop("multi_class", None) == "ovr"
+        model = LogisticRegression(**params)
+        if one_vs_rest:
+            model = OneVsRestClassifier(model, n_jobs=OVR_N_JOBS)
+        
+        # A single fit gets every core for BLAS; per-genre fits share one matrix, so
+        # threads avoid copying it into worker processes
+        with threadpool_limits(limits=os.cpu_count(), user_api="blas"), \
+                parallel_config(backend="threading"):
+            model.fit(X_train, y_train, **_fit_params(model, y_train))
+    
+    # Store weights as float32 to halve the bandwidth of sparse matvecs at inference
+    estimators = getattr(model, "estimators_", [model])
+    for estimator in estimators:
+        estimator.coef_ = estimator.coef_.astype(np.float32)
+        estimator.intercept_ = estimator.intercept_.astype(np.float32)
     
     elapsed = time.time() - start_time
     
     print(f"✅ Training complete in {elapsed:.2f}s")
-    print(f"   Model coefficients shape: {model.coef_.shape}")
+    print(f"   Model coefficients shape: {(len(model.classes_), X_train.shape[1])}")
     
     return model
 
 
-def evaluate_model(model, X_train, X_test, y_train, y_test):
-    """Comprehensive model evaluation"""
+def evaluate_model(model, X_test, y_test, class_names, X_train=None, y_train=None):
+    """Comprehensive model evaluation; pass X_train/y_train to also check for overfitting"""
     print("\n📈 EVALUATING MODEL PERFORMANCE")
     print("="*60)
     
-    # Training accuracy
-    train_pred = model.predict(X_train)
-    train_accuracy = accuracy_score(y_train, train_pred)
-    print(f"Training Accuracy: {train_accuracy * 100:.2f}%")
+    # Training accuracy (a full pass over the largest matrix, so only on request)
+    if X_train is not None:
+        train_accuracy = model.score(X_train, y_train)
+        print(f"Training Accuracy: {train_accuracy * 100:.2f}%")
     
     # Test accuracy
     test_pred = model.predict(X_test)
@@ -164,24 +453,36 @@ def evaluate_model(model, X_train, X_test, y_train, y_test):
     print(f"F1 Score (weighted): {f1:.4f}")
     
     # Check for overfitting
-    overfit_diff = train_accuracy - test_accuracy
-    if overfit_diff > 0.1:
-        print(f"⚠️  WARNING: Potential overfitting detected (diff: {overfit_diff*100:.2f}%)")
+    if X_train is not None:
+        overfit_diff = train_accuracy - test_accuracy
+        if overfit_diff > 0.1:
+            print(f"⚠️  WARNING: Potential overfitting detected (diff: {overfit_diff*100:.2f}%)")
     
     # Detailed classification report
     print("\n📋 Classification Report:")
     print("-" * 60)
-    print(classification_report(y_test, test_pred, zero_division=0))
+    print(classification_report(
+        y_test, test_pred,
+        labels=np.arange(len(class_names)),
+        target_names=class_names,
+        zero_division=0
+    ))
     
     return test_accuracy, f1, test_pred
 
 
-def perform_cross_validation(model, X_train, y_train, cv_folds):
-    """Perform k-fold cross-validation for robustness check"""
-    print(f"\n🔄 Running {cv_folds}-fold cross-validation...")
+def perform_cross_validation(model, X_train, y_train, cv_splits):
+    """Perform k-fold cross-validation over precomputed (train_idx, test_idx) splits"""
+    print(f"\n🔄 Running {len(cv_splits)}-fold cross-validation...")
     
     start_time = time.time()
-    cv_scores = cross_val_score(model, X_train, y_train, cv=cv_folds)
+    # Parallelism comes from the folds: each loky worker gets one BLAS/OpenMP
+    # thread so the fold processes don't oversubscribe the cores
+    with parallel_config(backend="loky", inner_max_num_threads=1):
+        cv_scores = cross_val_score(
+            model, X_train, y_train, cv=cv_splits, n_jobs=CV_N_JOBS,
+            params=_fit_params(model, y_train)
+        )
     elapsed = time.time() - start_time
     
     print(f"✅ Cross-validation complete in {elapsed:.2f}s")
@@ -191,22 +492,77 @@ def perform_cross_validation(model, X_train, y_train, cv_folds):
     return cv_scores
 
 
-def save_artifacts(model, vectorizer, model_path, vectorizer_path):
-    """Save trained model and vectorizer to disk"""
+def save_artifacts(model, vectorizer, model_path, vectorizer_path, class_names, classes_path,
+                   pipeline_path):
+    """Save trained model, vectorizer, fused pipeline and genre names to disk"""
     print("\n💾 Saving model artifacts...")
     
     # Ensure output directory exists
     Path(model_path).parent.mkdir(parents=True, exist_ok=True)
     
-    # Save with compression
-    joblib.dump(model, model_path, compress=3)
-    joblib.dump(vectorizer, vectorizer_path, compress=3)
+    # Save uncompressed so the API can memory-map the arrays (mmap_mode="r"); joblib
+    # drops mmap_mode for compressed files. Protocol 5 pickles the rest as raw buffers.
+    joblib.dump(model, model_path, compress=0, protocol=5)
+    joblib.dump(vectorizer, vectorizer_path, compress=0, protocol=5)
+    
+    # Raw titles → label codes in one predict() call
+    pipeline = Pipeline([("tfidf", vectorizer), ("clf", model)])
+    joblib.dump(pipeline, pipeline_path, compress=0, protocol=5)
+    
+    # The model predicts int32 label codes; this maps them back to genres
+    with open(classes_path, "w", encoding="utf-8") as f:
+        json.dump(class_names, f)
     
     model_size = os.path.getsize(model_path) / 1024  # KB
     vec_size = os.path.getsize(vectorizer_path) / 1024  # KB
+    pipeline_size = os.path.getsize(pipeline_path) / 1024  # KB
     
     print(f"✅ Model saved: {model_path} ({model_size:.2f} KB)")
     print(f"✅ Vectorizer saved: {vectorizer_path} ({vec_size:.2f} KB)")
+    print(f"✅ Pipeline saved: {pipeline_path} ({pipeline_size:.2f} KB)")
+    print(f"✅ Genre names saved: {classes_path}")
+
+
+def _argmax_linear(data, indices, indptr, coef_t, intercept):
+    """Row-wise argmax(x @ coef_t + intercept) straight off the CSR arrays"""
+    n_rows = indptr.shape[0] - 1
+    codes = np.empty(n_rows, dtype=np.int32)
+    scores = np.empty(intercept.shape[0], dtype=np.float32)
+    for row in range(n_rows):
+        scores[:] = intercept
+        for j in range(indptr[row], indptr[row + 1]):
+            scores += data[j] * coef_t[indices[j]]
+        codes[row] = np.argmax(scores)
+    return codes
+
+
+if njit is not None:
+    _argmax_linear = njit(cache=True)(_argmax_linear)
+
+
+def build_fast_predict(pipeline):
+    """Titles → label codes from the pipeline's weights, bypassing sklearn's predict dispatch"""
+    vectorizer = pipeline.named_steps["tfidf"]
+    model = pipeline.named_steps["clf"]
+    
+    # One weight row per genre for multinomial and one-vs-rest models alike
+    estimators = getattr(model, "estimators_", [model])
+    coef = np.vstack([estimator.coef_ for estimator in estimators]).astype(np.float32)
+    intercept = np.concatenate([estimator.intercept_ for estimator in estimators]).astype(np.float32)
+    if coef.shape[0] == 1:
+        # Binary LogisticRegression: a single row scores the second class against zero
+        coef = np.vstack([np.zeros_like(coef), coef])
+        intercept = np.concatenate([np.zeros_like(intercept), intercept])
+    coef_t = np.ascontiguousarray(coef.T)
+    
+    if njit is None:
+        return lambda titles: np.argmax(vectorizer.transform(titles) @ coef_t + intercept, axis=1)
+    
+    def predict(titles):
+        X = vectorizer.transform(titles).tocsr()
+        return _argmax_linear(X.data, X.indices, X.indptr, coef_t, intercept)
+    
+    return predict
 
 
 def print_training_summary(accuracy, f1, cv_scores):
@@ -216,7 +572,8 @@ def print_training_summary(accuracy, f1, cv_scores):
     print("="*60)
     print(f"✅ Test Accuracy: {accuracy * 100:.2f}%")
     print(f"✅ F1 Score: {f1:.4f}")
-    print(f"✅ CV Mean Accuracy: {cv_scores.mean() * 100:.2f}%")
+    if cv_scores is not None:
+        print(f"✅ CV Mean Accuracy: {cv_scores.mean() * 100:.2f}%")
     print("="*60)
     print("\n🎉 Model training completed successfully!\n")
 
@@ -233,24 +590,32 @@ def main():
     try:
         # Step 1: Validate and load data
         validate_data_file(PROCESSED_DATA_PATH)
-        df = load_and_validate_data(PROCESSED_DATA_PATH)
         
-        # Step 2: Filter rare genres
-        df = filter_rare_genres(df, MIN_SAMPLES_PER_GENRE)
+        # Step 2: Filter rare genres (cached until the CSV changes)
+        df = load_filtered_data(PROCESSED_DATA_PATH, MIN_SAMPLES_PER_GENRE)
         
-        # Step 3: Prepare features and labels
-        X = df["title"]
-        y = df["genre"]
-        print_dataset_stats(X, y)
+        # Step 3: Prepare features and labels (genres as compact int32 codes)
+        genres = df["genre"].astype("category")
+        class_names = genres.cat.categories.tolist()
+        y = genres.cat.codes.to_numpy(np.int32)
+        print_dataset_stats(df["title"], y, class_names)
+        
+        # One bulk copy out of Arrow; iterating the Arrow column cell by cell
+        # in the tokenizer would box every title separately
+        X = df["title"].to_numpy(dtype=object)
         
         # Step 4: Split data
         print(f"\n✂️  Splitting data (test size: {TEST_SIZE * 100}%)...")
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, 
-            test_size=TEST_SIZE, 
-            random_state=RANDOM_STATE, 
-            stratify=y
+        # Same split as train_test_split(stratify=y), but only index arrays are
+        # built; X[idx] below copies title pointers, never the strings
+        splitter = StratifiedShuffleSplit(
+            n_splits=1,
+            test_size=TEST_SIZE,
+            random_state=RANDOM_STATE
         )
+        train_idx, test_idx = next(splitter.split(X, y))
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
         print(f"   Training samples: {len(X_train):,}")
         print(f"   Test samples: {len(X_test):,}")
         
@@ -260,31 +625,43 @@ def main():
             "stop_words": "english",
             "max_features": TFIDF_MAX_FEATURES,
             "min_df": 2,  # Ignore terms that appear in fewer than 2 documents
-            "sublinear_tf": True  # Apply sublinear tf scaling (1 + log(tf))
+            "sublinear_tf": True,  # Apply sublinear tf scaling (1 + log(tf))
+            "dtype": np.float32  # Half the memory traffic of float64 features
         }
-        X_train_vec, X_test_vec, vectorizer = create_features(
+        X_train_vec, X_test_vec, vectorizer = load_or_create_features(
             X_train, X_test, vectorizer_params
         )
         
         # Step 6: Train model
-        model_params = {
-            "max_iter": MODEL_MAX_ITER,
-            "random_state": RANDOM_STATE,
-            "solver": "lbfgs",  # Good for multiclass problems (auto-handles multiclass)
-            "class_weight": "balanced"  # Handle imbalanced genres - CRITICAL for accuracy!
-        }
+        model_params = _pick_solver(X_train_vec, y_train)
         model = train_model(X_train_vec, y_train, model_params)
         
         # Step 7: Cross-validation
-        cv_scores = perform_cross_validation(model, X_train_vec, y_train, CV_FOLDS)
+        if model_params["solver"] == "qn":
+            # Folds would clone the CPU copy of the model and re-fit with lbfgs on the CPU
+            print("\n⏭️  Skipping cross-validation for the GPU (cuML) model")
+            cv_scores = None
+        else:
+            # Fold indices computed once; workers only receive index arrays
+            cv_splits = list(StratifiedKFold(
+                n_splits=CV_FOLDS,
+                shuffle=True,
+                random_state=RANDOM_STATE
+            ).split(X_train_vec, y_train))
+            cv_scores = perform_cross_validation(model, X_train_vec, y_train, cv_splits)
         
         # Step 8: Evaluate on test set
         accuracy, f1, predictions = evaluate_model(
-            model, X_train_vec, X_test_vec, y_train, y_test
+            model, X_test_vec, y_test, class_names,
+            X_train=X_train_vec if EVAL_TRAIN_ACCURACY else None,
+            y_train=y_train
         )
         
         # Step 9: Save model artifacts
-        save_artifacts(model, vectorizer, MODEL_OUTPUT_PATH, VECTORIZER_OUTPUT_PATH)
+        save_artifacts(
+            model, vectorizer, MODEL_OUTPUT_PATH, VECTORIZER_OUTPUT_PATH,
+            class_names, CLASSES_OUTPUT_PATH, PIPELINE_OUTPUT_PATH
+        )
         
         # Step 10: Print summary
         print_training_summary(accuracy, f1, cv_scores)
@@ -304,18 +681,19 @@ if __name__ == "__main__":
     print("🧪 TESTING MODEL WITH SAMPLE PREDICTIONS")
     print("="*60)
     
-    # Load saved model and vectorizer
-    model = joblib.load(MODEL_OUTPUT_PATH)
-    vectorizer = joblib.load(VECTORIZER_OUTPUT_PATH)
+    # Load the saved pipeline (arrays memory-mapped) and genre names
+    pipeline = joblib.load(PIPELINE_OUTPUT_PATH, mmap_mode="r")
+    with open(CLASSES_OUTPUT_PATH, encoding="utf-8") as f:
+        class_names = json.load(f)
     
     # Test samples
     sample_titles = ["the conjuring", "iron man", "toy story"]
-    sample_vec = vectorizer.transform(sample_titles)
-    predictions = model.predict(sample_vec)
+    predict = build_fast_predict(pipeline)
+    predictions = predict(sample_titles)
     
     print("\nSample Predictions:")
-    for title, genre in zip(sample_titles, predictions):
-        print(f"  '{title}' → {genre}")
+    for title, code in zip(sample_titles, predictions):
+        print(f"  '{title}' → {class_names[code]}")
     
     print("\n✅ Model test complete!")
     print("="*60 + "\n")